@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Script para exportar el índice completo (palabras, n-gramas y videos) a JSONL o Parquet.
+
+Lee la base de datos por bloques con fetchmany, así que la memoria usada es
+constante aunque el índice ocupe varios GB.
+"""
+import argparse
+import sqlite3
+import json
+import os
+from functools import partial
+from typing import List, Tuple, Optional, Iterator
+
+
+DEFAULT_ROW_GROUP_SIZE = 1000000
+
+
+# Consultas por tabla: (SQL base, columnas exportadas con su tipo, alias de la tabla)
+TABLES = {
+    "words": (
+        """
+        SELECT w.token, w.t_start, w.t_end, w.conf, w.video_id, v.path
+        FROM word_index w
+        LEFT JOIN videos v ON v.id = w.video_id
+        """,
+        [("token", "string"), ("t_start", "float"), ("t_end", "float"),
+         ("conf", "float"), ("video_id", "int"), ("video", "string")],
+        "w"
+    ),
+    "ngrams": (
+        """
+        SELECT n.ngram, n.t_start, n.t_end, n.conf, n.video_id, v.path
+        FROM ngram_index n
+        LEFT JOIN videos v ON v.id = n.video_id
+        """,
+        [("ngram", "string"), ("t_start", "float"), ("t_end", "float"),
+         ("conf", "float"), ("video_id", "int"), ("video", "string")],
+        "n"
+    ),
+    "videos": (
+        """
+        SELECT v.id, v.path, v.language, v.language_prob, v.duration, v.model, v.indexed_at
+        FROM videos v
+        """,
+        [("video_id", "int"), ("path", "string"), ("language", "string"),
+         ("language_prob", "float"), ("duration", "float"), ("model", "string"),
+         ("indexed_at", "string")],
+        None
+    ),
+}
+
+# Índices de versiones anteriores (sin tabla videos ni columna video_id):
+# mismas columnas, con video_id/video a NULL
+LEGACY_SQL = {
+    "words": "SELECT w.token, w.t_start, w.t_end, w.conf, NULL, NULL FROM word_index w",
+    "ngrams": "SELECT n.ngram, n.t_start, n.t_end, n.conf, NULL, NULL FROM ngram_index n",
+}
+
+
+def has_video_metadata(conn: sqlite3.Connection) -> bool:
+    """Indica si el índice tiene la tabla videos (con complete) y la columna video_id."""
+    has_videos = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos'"
+    ).fetchone()
+    if not has_videos:
+        return False
+
+    for table, column in (("word_index", "video_id"), ("ngram_index", "video_id"), ("videos", "complete")):
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        if column not in columns:
+            return False
+
+    return True
+
+
+def build_query(
+    table: str,
+    video: Optional[str] = None,
+    t_from: Optional[float] = None,
+    t_to: Optional[float] = None,
+    min_confidence: Optional[float] = None,
+    legacy: bool = False
+) -> Tuple[str, List]:
+    """
+    Construye la consulta SQL con los filtros opcionales.
+
+    El filtro de video acepta el id numérico o la ruta del video; los filtros
+    de tiempo y confianza no aplican a la tabla de videos. Los videos que se
+    están indexando (complete = 0) se omiten. Con legacy=True (índice sin
+    metadatos de video) no hay filtro de video.
+    """
+    sql, _, alias = TABLES[table]
+    conditions = []
+    params = []
+
+    if legacy:
+        if video is not None:
+            raise ValueError("El índice no tiene metadatos de video: no se puede filtrar por video")
+        sql = LEGACY_SQL[table]
+    elif alias:
+        conditions.append(f"({alias}.video_id IS NULL OR v.complete = 1)")
+    else:
+        conditions.append("v.complete = 1")
+
+    if video is not None:
+        video_column = f"{alias}.video_id" if alias else "v.id"
+        if video.isdigit():
+            conditions.append(f"{video_column} = ?")
+            params.append(int(video))
+        else:
+            conditions.append(f"{video_column} IN (SELECT id FROM videos WHERE path = ?)")
+            params.append(os.path.abspath(video))
+
+    if alias:
+        if t_from is not None:
+            conditions.append(f"{alias}.t_start >= ?")
+            params.append(t_from)
+        if t_to is not None:
+            conditions.append(f"{alias}.t_end <= ?")
+            params.append(t_to)
+        if min_confidence is not None:
+            conditions.append(f"{alias}.conf >= ?")
+            params.append(min_confidence)
+
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+
+    return sql, params
+
+
+def iter_chunks(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: List,
+    chunk_size: int = 10000
+) -> Iterator[List[Tuple]]:
+    """Recorre el resultado de la consulta en bloques de chunk_size filas."""
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+    cursor.close()
+
+
+def write_jsonl(chunks: Iterator[List[Tuple]], columns: List[Tuple[str, str]], out_path: str) -> int:
+    """Escribe las filas como JSON Lines (un objeto por línea)."""
+    names = [name for name, _ in columns]
+    total = 0
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        for rows in chunks:
+            for row in rows:
+                f.write(json.dumps(dict(zip(names, row)), ensure_ascii=False))
+                f.write("\n")
+            total += len(rows)
+
+    return total
+
+
+def write_parquet(
+    chunks: Iterator[List[Tuple]],
+    columns: List[Tuple[str, str]],
+    out_path: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> int:
+    """
+    Escribe las filas en Parquet (requiere pyarrow).
+
+    Los bloques leídos se acumulan hasta row_group_size filas antes de
+    escribir cada row group: la memoria sigue acotada y el archivo no
+    acaba con miles de row groups diminutos.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Para exportar a Parquet instala pyarrow: pip install pyarrow")
+
+    arrow_types = {"string": pa.string(), "float": pa.float64(), "int": pa.int64()}
+    schema = pa.schema([(name, arrow_types[kind]) for name, kind in columns])
+    total = 0
+    pending = []
+    pending_rows = 0
+
+    # El esquema es fijo: un bloque con solo NULLs no cambia el tipo de la columna
+    with pq.ParquetWriter(out_path, schema) as writer:
+        for rows in chunks:
+            arrays = [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*rows), schema)
+            ]
+            pending.append(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            pending_rows += len(rows)
+            total += len(rows)
+
+            if pending_rows >= row_group_size:
+                writer.write_table(pa.Table.from_batches(pending, schema=schema), row_group_size=row_group_size)
+                pending = []
+                pending_rows = 0
+
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema=schema), row_group_size=row_group_size)
+
+    return total
+
+
+def export_index(
+    db_path: str,
+    out_dir: str,
+    tables: List[str],
+    fmt: str = "jsonl",
+    video: Optional[str] = None,
+    t_from: Optional[float] = None,
+    t_to: Optional[float] = None,
+    min_confidence: Optional[float] = None,
+    chunk_size: int = 10000,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> List[Tuple[str, int]]:
+    """
+    Exporta las tablas pedidas a out_dir/<tabla>.<formato>.
+
+    Returns:
+        Lista de tuplas (ruta, filas exportadas)
+    """
+    if fmt == "parquet":
+        writer = partial(write_parquet, row_group_size=row_group_size)
+    else:
+        writer = write_jsonl
+    os.makedirs(out_dir, exist_ok=True)
+
+    conn = sqlite3.connect(db_path)
+    exported = []
+
+    try:
+        legacy = not has_video_metadata(conn)
+        if legacy:
+            print("⚠️  Índice de una versión anterior: video_id/video se exportan vacíos")
+
+        for table in tables:
+            if legacy and table == "videos":
+                print("   ⏭️  videos: el índice no tiene metadatos de video")
+                continue
+
+            sql, params = build_query(table, video, t_from, t_to, min_confidence, legacy)
+            columns = TABLES[table][1]
+            out_path = os.path.join(out_dir, f"{table}.{fmt}")
+
+            print(f"📤 Exportando {table} → {out_path}...")
+            total = writer(iter_chunks(conn, sql, params, chunk_size), columns, out_path)
+            print(f"   ✅ {total:,} filas")
+
+            exported.append((out_path, total))
+    finally:
+        conn.close()
+
+    return exported
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Exporta el índice completo a JSONL o Parquet para análisis"
+    )
+    parser.add_argument(
+        "--db",
+        default="index.db",
+        help="Ruta a la base de datos SQLite (default: index.db)"
+    )
+    parser.add_argument(
+        "--out-dir",
+        default="export",
+        help="Carpeta de salida (default: export)"
+    )
+    parser.add_argument(
+        "--format",
+        default="jsonl",
+        choices=["jsonl", "parquet"],
+        help="Formato de salida (default: jsonl; parquet requiere pyarrow)"
+    )
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        default=list(TABLES),
+        choices=list(TABLES),
+        help="Tablas a exportar (default: words ngrams videos)"
+    )
+    parser.add_argument(
+        "--video",
+        help="Exportar solo un video (id o ruta del video indexado)"
+    )
+    parser.add_argument(
+        "--from",
+        dest="t_from",
+        type=float,
+        help="Exportar solo ocurrencias desde este segundo"
+    )
+    parser.add_argument(
+        "--to",
+        dest="t_to",
+        type=float,
+        help="Exportar solo ocurrencias hasta este segundo"
+    )
+    parser.add_argument(
+        "--min-conf",
+        type=float,
+        default=None,
+        help="Confianza mínima (default: sin filtro)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="Filas leídas por bloque (default: 10000)"
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"Filas por row group en Parquet (default: {DEFAULT_ROW_GROUP_SIZE})"
+    )
+
+    args = parser.parse_args()
+
+    # Verificar que la base de datos existe
+    if not os.path.exists(args.db):
+        print(f"❌ Error: No se encuentra la base de datos {args.db}")
+        print("   Ejecuta primero run_index.py para crear el índice.")
+        return
+
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("❌ Error: Para exportar a Parquet instala pyarrow:")
+            print("   pip install pyarrow")
+            return
+
+    if args.video is not None:
+        conn = sqlite3.connect(args.db)
+        has_metadata = has_video_metadata(conn)
+        conn.close()
+
+        if not has_metadata:
+            print("❌ Error: El índice es de una versión anterior (sin metadatos de video),")
+            print("   no se puede filtrar con --video. Exporta sin --video o vuelve a indexar.")
+            return
+
+    export_index(
+        db_path=args.db,
+        out_dir=args.out_dir,
+        tables=args.tables,
+        fmt=args.format,
+        video=args.video,
+        t_from=args.t_from,
+        t_to=args.t_to,
+        min_confidence=args.min_conf,
+        chunk_size=args.chunk_size,
+        row_group_size=args.row_group_size
+    )
+
+    print(f"\n✨ Exportación completada en: {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
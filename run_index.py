@@ -6,11 +6,23 @@ import argparse
 import sqlite3
 import subprocess
 import os
+import json
+import time
+import datetime
+import itertools
+import statistics
 import multiprocessing
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
+import numpy as np
 from unidecode import unidecode
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
+
+
+DEFAULT_PROFILE_PATH = "tuning_profile.json"
+SAMPLE_RATE = 16000
+DEFAULT_BEAM_SIZE = 5
+CALIBRATION_RUNS = 3
 
 
 def detect_hardware() -> Dict[str, any]:
@@ -54,13 +66,243 @@ def detect_hardware() -> Dict[str, any]:
     return config
 
 
+def load_profile(
+    profile_path: str,
+    device: str,
+    cpu_cores: int,
+    model_size: str
+) -> Optional[Dict[str, any]]:
+    """
+    Carga el perfil de calibración guardado por --calibrate.
+    
+    Solo se devuelve si fue medido en el mismo hardware (device y cores) y con
+    el mismo modelo; si no existe o no coincide, devuelve None.
+    """
+    if not os.path.exists(profile_path):
+        return None
+    
+    try:
+        with open(profile_path, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  No se pudo leer el perfil {profile_path}: {e}")
+        return None
+    
+    if profile.get('device') != device or profile.get('cpu_cores') != cpu_cores:
+        print(f"⚠️  El perfil {profile_path} es de otro hardware, se ignora (usa --calibrate)")
+        return None
+    
+    if profile.get('model') != model_size:
+        print(f"⚠️  El perfil {profile_path} se midió con el modelo '{profile.get('model')}', "
+              f"se ignora para '{model_size}' (usa --calibrate --model {model_size})")
+        return None
+    
+    return profile
+
+
+def save_profile(profile: Dict[str, any], profile_path: str):
+    """Guarda el perfil de calibración en JSON."""
+    with open(profile_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
+    
+    print(f"💾 Perfil guardado en: {profile_path}")
+
+
+def synthetic_audio(seconds: float) -> np.ndarray:
+    """
+    Genera un clip sintético a 16kHz parecido a voz (tono armónico con
+    entonación y sílabas de ~4 Hz) para calibrar sin video.
+    """
+    t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None)
+    noise = np.random.default_rng(0).normal(0, 0.01, t.shape)
+    audio = 0.3 * voice * syllables + noise
+    return audio.astype(np.float32)
+
+
+def calibration_grid(
+    device: str,
+    cpu_cores: int,
+    compute_type: Optional[str] = None
+) -> List[Dict[str, any]]:
+    """
+    Combinaciones a medir: compute_type x cpu_threads.
+    
+    num_workers queda fijo en 1: solo ayuda con varias transcripciones
+    simultáneas y la indexación procesa un único audio.
+    """
+    if compute_type:
+        compute_types = [compute_type]
+    elif device == 'cuda':
+        compute_types = ['float16', 'int8_float16', 'int8', 'float32']
+    else:
+        compute_types = ['int8', 'int8_float32', 'float32']
+    
+    if device == 'cuda':
+        thread_options = [max(1, min(cpu_cores, 4))]
+    else:
+        thread_options = sorted({max(1, cpu_cores // 2), max(1, cpu_cores - 2), cpu_cores})
+    
+    return [
+        {'compute_type': ct, 'cpu_threads': threads, 'num_workers': 1}
+        for ct, threads in itertools.product(compute_types, thread_options)
+    ]
+
+
+def time_transcription(
+    model: WhisperModel,
+    audio: np.ndarray,
+    beam_size: int,
+    runs: int = CALIBRATION_RUNS
+) -> Tuple[float, str]:
+    """
+    Transcribe el clip `runs` veces igual que la indexación (VAD y word
+    timestamps) y devuelve la mediana de segundos y el texto normalizado.
+    """
+    timings = []
+    text = ""
+    
+    for _ in range(runs):
+        start = time.perf_counter()
+        segments, info = model.transcribe(
+            audio,
+            word_timestamps=True,
+            vad_filter=True,
+            language="es",
+            beam_size=beam_size
+        )
+        text = normalize_text(" ".join(segment.text for segment in segments))  # la transcripción es perezosa
+        timings.append(time.perf_counter() - start)
+        
+        if info.duration_after_vad <= 0:
+            raise RuntimeError("El VAD no encontró voz en el clip de calibración; usa --video con un video hablado")
+    
+    return statistics.median(timings), text
+
+
+def calibrate(
+    hw_config: Dict[str, any],
+    model_size: str = "small",
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    video_path: Optional[str] = None,
+    seconds: float = 20.0,
+    profile_path: str = DEFAULT_PROFILE_PATH
+) -> Dict[str, any]:
+    """
+    Micro-benchmark de transcripción: prueba cada combinación de
+    calibration_grid() sobre un clip corto con beam size 5, mide el
+    real-time factor (segundos de cómputo / segundos de audio) y guarda la mejor.
+    
+    El beam size solo baja a 1 si, con un clip real, su transcripción es
+    idéntica a la de beam 5; nunca se elige solo por velocidad.
+    """
+    device = device or hw_config['device']
+    print(f"⏱️  Calibrando modelo '{model_size}' en {device} ({hw_config['cpu_cores']} cores)...")
+    
+    if video_path:
+        clip_path = "calibrate_16k.wav"
+        try:
+            extract_audio(video_path, clip_path, max_seconds=seconds)
+            audio = decode_audio(clip_path, sampling_rate=SAMPLE_RATE)
+        finally:
+            if os.path.exists(clip_path):
+                os.remove(clip_path)
+        source = video_path
+    else:
+        audio = synthetic_audio(seconds)
+        source = "synthetic"
+    
+    duration = len(audio) / SAMPLE_RATE
+    print(f"   🎵 Clip: {source} ({duration:.1f}s), mediana de {CALIBRATION_RUNS} ejecuciones")
+    
+    results = []
+    best = None  # (rtf sin redondear, config, modelo) de la configuración más rápida
+    
+    for config in calibration_grid(device, hw_config['cpu_cores'], compute_type):
+        try:
+            model = WhisperModel(
+                model_size,
+                device=device,
+                compute_type=config['compute_type'],
+                num_workers=config['num_workers'],
+                cpu_threads=config['cpu_threads']
+            )
+        except ValueError as e:
+            # compute_type no soportado por este hardware
+            print(f"   ⏭️  {config['compute_type']}: no soportado ({e})")
+            continue
+        
+        # Calentamiento: la primera llamada incluye inicialización
+        segments, _ = model.transcribe(audio[:SAMPLE_RATE * 2], language="es", beam_size=1)
+        list(segments)
+        
+        elapsed, _ = time_transcription(model, audio, beam_size=DEFAULT_BEAM_SIZE)
+        rtf = elapsed / duration
+        
+        results.append({**config, 'beam_size': DEFAULT_BEAM_SIZE, 'rtf': round(rtf, 4)})
+        print(f"   {config['compute_type']:>13} | threads {config['cpu_threads']:2d} → RTF {rtf:.3f}")
+        
+        if best is None or rtf < best[0]:
+            best = (rtf, config, model)
+        del model
+    
+    if best is None:
+        raise RuntimeError("Ninguna configuración pudo ejecutarse durante la calibración")
+    
+    best_rtf, best_config, best_model = best
+    
+    # Beam size: comparar greedy (1) con el valor por defecto sobre el mejor modelo
+    beam_size = DEFAULT_BEAM_SIZE
+    elapsed_greedy, text_greedy = time_transcription(best_model, audio, beam_size=1)
+    _, text_default = time_transcription(best_model, audio, beam_size=DEFAULT_BEAM_SIZE, runs=1)
+    greedy_matches = text_greedy == text_default
+    
+    print(f"   beam 1 → RTF {elapsed_greedy / duration:.3f} "
+          f"({'misma' if greedy_matches else 'distinta'} transcripción que beam {DEFAULT_BEAM_SIZE})")
+    if source == "synthetic":
+        print(f"   ℹ️  Con clip sintético no se puede validar la calidad: se mantiene beam {DEFAULT_BEAM_SIZE}")
+    elif greedy_matches:
+        beam_size = 1
+    
+    profile = {
+        'device': device,
+        'cpu_cores': hw_config['cpu_cores'],
+        'gpu_name': hw_config['gpu_name'],
+        'model': model_size,
+        'compute_type': best_config['compute_type'],
+        'cpu_threads': best_config['cpu_threads'],
+        'num_workers': best_config['num_workers'],
+        'beam_size': beam_size,
+        'rtf': round(best_rtf, 4),
+        'rtf_beam_1': round(elapsed_greedy / duration, 4),
+        'beam_1_matches': greedy_matches,
+        'clip': source,
+        'clip_seconds': round(duration, 2),
+        'results': results
+    }
+    
+    print(f"\n🏆 Mejor configuración: {best_config['compute_type']}, {best_config['cpu_threads']} threads, "
+          f"beam {beam_size} (RTF {best_rtf:.3f} con beam {DEFAULT_BEAM_SIZE})")
+    save_profile(profile, profile_path)
+    
+    return profile
+
+
 def normalize_text(text: str) -> str:
     """Normaliza texto: minúsculas sin acentos."""
     return unidecode(text).lower().strip()
 
 
-def extract_audio(video_path: str, audio_path: str = "audio_16k.wav") -> str:
-    """Extrae audio del video a 16kHz mono."""
+def extract_audio(
+    video_path: str,
+    audio_path: str = "audio_16k.wav",
+    max_seconds: Optional[float] = None
+) -> str:
+    """Extrae audio del video a 16kHz mono (opcionalmente solo los primeros max_seconds)."""
     print(f"📼 Extrayendo audio de {video_path}...")
     
     cmd = [
@@ -69,8 +311,10 @@ def extract_audio(video_path: str, audio_path: str = "audio_16k.wav") -> str:
         "-ar", "16000",  # 16kHz
         "-vn",  # sin video
         "-y",  # sobrescribir
-        audio_path
     ]
+    if max_seconds is not None:
+        cmd += ["-t", str(max_seconds)]
+    cmd.append(audio_path)
     
     try:
         subprocess.run(cmd, check=True, capture_output=True)
@@ -88,13 +332,28 @@ def create_database(db_path: str = "index.db") -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # Tabla de videos indexados (metadatos)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS videos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL,
+            language TEXT,
+            language_prob REAL,
+            duration REAL,
+            model TEXT,
+            indexed_at TEXT NOT NULL,
+            complete INTEGER NOT NULL DEFAULT 1
+        )
+    """)
+    
     # Tabla de palabras individuales
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS word_index (
             token TEXT NOT NULL,
             t_start REAL NOT NULL,
             t_end REAL NOT NULL,
-            conf REAL NOT NULL
+            conf REAL NOT NULL,
+            video_id INTEGER REFERENCES videos(id)
         )
     """)
     
@@ -109,7 +368,8 @@ def create_database(db_path: str = "index.db") -> sqlite3.Connection:
             ngram TEXT NOT NULL,
             t_start REAL NOT NULL,
             t_end REAL NOT NULL,
-            conf REAL NOT NULL
+            conf REAL NOT NULL,
+            video_id INTEGER REFERENCES videos(id)
         )
     """)
     
@@ -118,12 +378,30 @@ def create_database(db_path: str = "index.db") -> sqlite3.Connection:
         ON ngram_index(ngram)
     """)
     
+    # Bases de datos antiguas: añadir video_id (queda NULL en filas previas)
+    for table in ("word_index", "ngram_index"):
+        columns = [row[1] for row in cursor.execute(f"PRAGMA table_info({table})")]
+        if "video_id" not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN video_id INTEGER REFERENCES videos(id)")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_video ON {table}(video_id)")
+    
+    columns = [row[1] for row in cursor.execute("PRAGMA table_info(videos)")]
+    if "complete" not in columns:
+        cursor.execute("ALTER TABLE videos ADD COLUMN complete INTEGER NOT NULL DEFAULT 1")
+
     conn.commit()
     print("✅ Base de datos lista")
     
     return conn
 
 
+def delete_videos(cursor: sqlite3.Cursor, video_ids: List[Tuple[int]]):
+    """Borra los videos indicados junto con sus palabras y n-gramas."""
+    cursor.executemany("DELETE FROM word_index WHERE video_id = ?", video_ids)
+    cursor.executemany("DELETE FROM ngram_index WHERE video_id = ?", video_ids)
+    cursor.executemany("DELETE FROM videos WHERE id = ?", video_ids)
+
+
 def generate_ngrams(words: List[Tuple[str, float, float, float]], n: int = 2) -> List[Tuple[str, float, float, float]]:
     """Genera n-gramas a partir de una lista de palabras."""
     ngrams = []
@@ -144,16 +422,22 @@ def generate_ngrams(words: List[Tuple[str, float, float, float]], n: int = 2) ->
 def transcribe_and_index(
     audio_path: str,
     db_path: str = "index.db",
+    video_path: Optional[str] = None,
     model_size: str = "small",
     device: str = "cpu",
     compute_type: str = "int8",
     batch_size: int = 5000,
     min_confidence: float = 0.0,
-    num_workers: int = 4
+    num_workers: int = 4,
+    cpu_threads: Optional[int] = None,
+    beam_size: int = DEFAULT_BEAM_SIZE
 ):
     """Transcribe el audio e indexa palabras y n-gramas en SQLite."""
+    if cpu_threads is None:
+        cpu_threads = num_workers
+    
     print(f"🎙️  Iniciando transcripción con modelo '{model_size}' en {device}...")
-    print(f"   💪 Workers: {num_workers} (procesamiento paralelo)")
+    print(f"   💪 Workers: {num_workers}, threads: {cpu_threads} (procesamiento paralelo)")
     
     # Cargar modelo con workers paralelos
     model = WhisperModel(
@@ -161,16 +445,17 @@ def transcribe_and_index(
         device=device,
         compute_type=compute_type,
         num_workers=num_workers,
-        cpu_threads=num_workers
+        cpu_threads=cpu_threads
     )
     
     # Conectar a la base de datos con optimizaciones
     conn = create_database(db_path)
     cursor = conn.cursor()
     
-    # Optimizaciones de SQLite para velocidad
-    cursor.execute("PRAGMA synchronous = OFF")
-    cursor.execute("PRAGMA journal_mode = MEMORY")
+    # Optimizaciones de SQLite para velocidad (WAL: rápido y sin riesgo de
+    # corromper el índice si el proceso muere a mitad de un lote)
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    cursor.execute("PRAGMA journal_mode = WAL")
     cursor.execute("PRAGMA cache_size = 10000")
     conn.commit()
     
@@ -186,10 +471,37 @@ def transcribe_and_index(
         audio_path,
         word_timestamps=True,
         vad_filter=True,  # filtro de actividad de voz
-        language="es"  # ajusta según tu idioma
+        language="es",  # ajusta según tu idioma
+        beam_size=beam_size
     )
     
     print(f"📝 Idioma detectado: {info.language} (prob: {info.language_probability:.2f})")
+    
+    # Restos de una indexación interrumpida de este mismo video
+    video_abspath = os.path.abspath(video_path or audio_path)
+    stale_ids = [(row[0],) for row in cursor.execute(
+        "SELECT id FROM videos WHERE path = ? AND complete = 0", (video_abspath,)
+    )]
+    if stale_ids:
+        print("🧹 Eliminando restos de una indexación interrumpida de este video")
+        delete_videos(cursor, stale_ids)
+    
+    # Registrar el video como incompleto: sus filas se escriben por lotes con
+    # un id nuevo y solo al final sustituyen a una indexación anterior
+    cursor.execute(
+        "INSERT INTO videos (path, language, language_prob, duration, model, indexed_at, complete) "
+        "VALUES (?, ?, ?, ?, ?, ?, 0)",
+        (
+            video_abspath,
+            info.language,
+            info.language_probability,
+            info.duration,
+            model_size,
+            datetime.datetime.now().isoformat(timespec="seconds")
+        )
+    )
+    video_id = cursor.lastrowid
+    conn.commit()
     print("⏳ Procesando segmentos...")
     
     segment_words = []
@@ -211,7 +523,8 @@ def transcribe_and_index(
                 token,
                 word.start,
                 word.end,
-                word.probability
+                word.probability,
+                video_id
             ))
             
             segment_words.append((token, word.start, word.end, word.probability))
@@ -220,7 +533,7 @@ def transcribe_and_index(
             # Insertar por lotes
             if len(word_buffer) >= batch_size:
                 cursor.executemany(
-                    "INSERT INTO word_index (token, t_start, t_end, conf) VALUES (?, ?, ?, ?)",
+                    "INSERT INTO word_index (token, t_start, t_end, conf, video_id) VALUES (?, ?, ?, ?, ?)",
                     word_buffer
                 )
                 conn.commit()
@@ -231,19 +544,19 @@ def transcribe_and_index(
         if len(segment_words) >= 2:
             # Bigramas
             bigrams = generate_ngrams(segment_words, n=2)
-            ngram_buffer.extend(bigrams)
+            ngram_buffer.extend((*ngram, video_id) for ngram in bigrams)
             total_ngrams += len(bigrams)
             
             # Trigramas
             if len(segment_words) >= 3:
                 trigrams = generate_ngrams(segment_words, n=3)
-                ngram_buffer.extend(trigrams)
+                ngram_buffer.extend((*ngram, video_id) for ngram in trigrams)
                 total_ngrams += len(trigrams)
         
         # Insertar n-gramas por lotes
         if len(ngram_buffer) >= batch_size:
             cursor.executemany(
-                "INSERT INTO ngram_index (ngram, t_start, t_end, conf) VALUES (?, ?, ?, ?)",
+                "INSERT INTO ngram_index (ngram, t_start, t_end, conf, video_id) VALUES (?, ?, ?, ?, ?)",
                 ngram_buffer
             )
             conn.commit()
@@ -254,18 +567,25 @@ def transcribe_and_index(
     # Insertar los restos
     if word_buffer:
         cursor.executemany(
-            "INSERT INTO word_index (token, t_start, t_end, conf) VALUES (?, ?, ?, ?)",
+            "INSERT INTO word_index (token, t_start, t_end, conf, video_id) VALUES (?, ?, ?, ?, ?)",
             word_buffer
         )
-        conn.commit()
     
     if ngram_buffer:
         cursor.executemany(
-            "INSERT INTO ngram_index (ngram, t_start, t_end, conf) VALUES (?, ?, ?, ?)",
+            "INSERT INTO ngram_index (ngram, t_start, t_end, conf, video_id) VALUES (?, ?, ?, ?, ?)",
             ngram_buffer
         )
-        conn.commit()
     
+    # Transacción final corta: marcar completo y borrar la indexación anterior
+    old_ids = [(row[0],) for row in cursor.execute(
+        "SELECT id FROM videos WHERE path = ? AND id != ?", (video_abspath, video_id)
+    )]
+    if old_ids:
+        print("♻️  El video ya estaba indexado, se reemplaza su índice anterior")
+        delete_videos(cursor, old_ids)
+    cursor.execute("UPDATE videos SET complete = 1 WHERE id = ?", (video_id,))
+    conn.commit()
     conn.close()
     
     print(f"\n✅ Indexación completa:")
@@ -289,8 +609,7 @@ def main():
     )
     parser.add_argument(
         "--video",
-        required=True,
-        help="Ruta al archivo de video"
+        help="Ruta al archivo de video (requerido salvo con --calibrate)"
     )
     parser.add_argument(
         "--db",
@@ -334,34 +653,98 @@ def main():
         "--workers",
         type=int,
         default=None,
-        help=f"Número de workers/threads para procesamiento paralelo (default: auto={hw_config['num_workers']})"
+        help=f"Número de workers para procesamiento paralelo (default: auto={hw_config['num_workers']})"
+    )
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=None,
+        help="Threads de CPU por worker (default: perfil calibrado o igual a --workers)"
+    )
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        default=None,
+        help="Beam size de la decodificación (default: perfil calibrado o 5)"
     )
     parser.add_argument(
         "--auto",
         action="store_true",
         help="Usar configuración automática óptima según hardware detectado (recomendado)"
     )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Medir la configuración más rápida en este equipo y guardarla en --profile "
+             "(usa los primeros segundos de --video o un clip sintético)"
+    )
+    parser.add_argument(
+        "--calibrate-seconds",
+        type=float,
+        default=20.0,
+        help="Duración del clip de calibración en segundos (default: 20)"
+    )
+    parser.add_argument(
+        "--profile",
+        default=DEFAULT_PROFILE_PATH,
+        help=f"Perfil de calibración que se carga en modo auto (default: {DEFAULT_PROFILE_PATH})"
+    )
     
     args = parser.parse_args()
     
+    if args.calibrate:
+        if args.video and not os.path.exists(args.video):
+            print(f"❌ Error: No se encuentra el archivo {args.video}")
+            return
+        
+        calibrate(
+            hw_config,
+            model_size=args.model,
+            device=None if args.device == "auto" else args.device,
+            compute_type=args.compute_type,
+            video_path=args.video,
+            seconds=args.calibrate_seconds,
+            profile_path=args.profile
+        )
+        print("\n✨ Calibración completada. Las próximas ejecuciones en modo AUTO usarán este perfil.")
+        return
+    
+    if args.video is None:
+        parser.error("se requiere --video (o usa --calibrate)")
+    
     # Aplicar configuración automática si se solicita o si no se especificaron parámetros
     if args.auto or (args.device is None and args.workers is None):
         if args.device is None or args.device == "auto":
             args.device = hw_config['device']
+        
+        # El perfil calibrado sustituye a las reglas de detect_hardware()
+        profile = load_profile(args.profile, args.device, hw_config['cpu_cores'], args.model)
+        tuning = profile or hw_config
+        
         if args.compute_type is None:
-            args.compute_type = hw_config['compute_type']
+            args.compute_type = tuning['compute_type']
         if args.workers is None:
-            args.workers = hw_config['num_workers']
+            args.workers = tuning['num_workers']
+        if args.cpu_threads is None and profile:
+            args.cpu_threads = profile['cpu_threads']
+        if args.beam_size is None and profile:
+            args.beam_size = profile['beam_size']
         
         print("🤖 Modo AUTO-OPTIMIZACIÓN activado")
         print(f"   Hardware detectado:")
         print(f"   - CPU: {hw_config['cpu_cores']} cores")
         if hw_config['gpu_name']:
             print(f"   - GPU: {hw_config['gpu_name']}")
+        if profile:
+            print(f"   - Perfil calibrado: {args.profile} (RTF {profile['rtf']:.3f}, modelo {profile['model']})")
         print(f"\n   Configuración seleccionada:")
         print(f"   - Device: {args.device}")
         print(f"   - Compute type: {args.compute_type}")
         print(f"   - Workers: {args.workers}")
+        if args.cpu_threads is not None:
+            print(f"   - CPU threads: {args.cpu_threads}")
+        if args.beam_size is not None:
+            print(f"   - Beam size: {args.beam_size}")
         print(f"   - Modelo: {args.model}")
         
         # Advertir si hay GPU disponible pero no está instalado CUDA
@@ -379,6 +762,9 @@ def main():
         if args.workers is None:
             args.workers = 1
     
+    if args.beam_size is None:
+        args.beam_size = DEFAULT_BEAM_SIZE
+    
     # Verificar que el video existe
     if not os.path.exists(args.video):
         print(f"❌ Error: No se encuentra el archivo {args.video}")
@@ -392,11 +778,14 @@ def main():
         transcribe_and_index(
             audio_path=audio_path,
             db_path=args.db,
+            video_path=args.video,
             model_size=args.model,
             device=args.device,
             compute_type=args.compute_type,
             min_confidence=args.min_conf,
-            num_workers=args.workers
+            num_workers=args.workers,
+            cpu_threads=args.cpu_threads,
+            beam_size=args.beam_size
         )
         
         # Limpiar audio temporal